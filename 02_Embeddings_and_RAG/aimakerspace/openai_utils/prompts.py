@@ -2,6 +2,10 @@ import re
 from typing import Dict, List, Any, Optional, Union, Callable
 from abc import ABC, abstractmethod
 
+_PLACEHOLDER_PATTERN = re.compile(r"\{([^}]+)\}")
+_VARIABLE_PATTERN = re.compile(r'\{([^{}]+)\}')
+_CONDITIONAL_PATTERN = re.compile(r'\{if\s+([^}]+)\}(.*?)(?:\{else\}(.*?))?\{/if\}', re.DOTALL)
+
 
 class PromptValidationError(Exception):
     """Raised when prompt validation fails"""
@@ -27,8 +31,8 @@ class ConditionalPrompt:
         self.prompt = prompt
         self.strict = strict
         self.defaults = defaults or {}
-        self._var_pattern = re.compile(r'\{([^{}]+)\}')
-        self._conditional_pattern = re.compile(r'\{if\s+([^}]+)\}(.*?)(?:\{else\}(.*?))?\{/if\}', re.DOTALL)
+        self._var_pattern = _VARIABLE_PATTERN
+        self._conditional_pattern = _CONDITIONAL_PATTERN
         
     def format_prompt(self, **kwargs) -> str:
         """Format prompt with conditional logic evaluation"""
@@ -118,7 +122,7 @@ class BasePrompt:
         self.prompt = prompt
         self.strict = strict
         self.defaults = defaults or {}
-        self._pattern = re.compile(r"\{([^}]+)\}")
+        self._pattern = _PLACEHOLDER_PATTERN
         self._validate_template()
 
     def _validate_template(self) -> None:
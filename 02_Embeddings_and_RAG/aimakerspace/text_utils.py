@@ -50,10 +50,9 @@ class CharacterTextSplitter:
         self.chunk_overlap = chunk_overlap
 
     def split(self, text: str) -> List[str]:
-        chunks = []
-        for i in range(0, len(text), self.chunk_size - self.chunk_overlap):
-            chunks.append(text[i : i + self.chunk_size])
-        return chunks
+        chunk_size = self.chunk_size
+        step = chunk_size - self.chunk_overlap
+        return [text[i : i + chunk_size] for i in range(0, len(text), step)]
 
     def split_texts(self, texts: List[str]) -> List[str]:
         chunks = []
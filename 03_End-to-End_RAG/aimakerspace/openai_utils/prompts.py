@@ -1,13 +1,15 @@
 import re
 from typing import Any, Dict, List
 
+_PLACEHOLDER_PATTERN = re.compile(r"\{([^}]+)\}")
+
 
 class BasePrompt:
     """Simple string template helper used to format prompt text."""
 
     def __init__(self, prompt: str):
         self.prompt = prompt
-        self._pattern = re.compile(r"\{([^}]+)\}")
+        self._pattern = _PLACEHOLDER_PATTERN
 
     def format_prompt(self, **kwargs: Any) -> str:
         """Return the prompt with ``kwargs`` substituted for placeholders."""
@@ -1,8 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterable, List
 
-import PyPDF2
-
 
 class TextFileLoader:
     """Load plain-text documents from a single file or an entire directory."""
@@ -44,9 +43,10 @@ class TextFileLoader:
             )
 
     def _iter_directory(self, directory: Path) -> Iterable[str]:
-        for entry in sorted(directory.rglob("*.txt")):
-            if entry.is_file():
-                yield self._read_text_file(entry)
+        paths = [entry for entry in sorted(directory.rglob("*.txt")) if entry.is_file()]
+        # File reads release the GIL, so a thread pool overlaps their latency.
+        with ThreadPoolExecutor() as executor:
+            yield from executor.map(self._read_text_file, paths)
 
     def _read_text_file(self, file_path: Path) -> str:
         with file_path.open("r", encoding=self.encoding) as file_handle:
@@ -70,8 +70,9 @@ class CharacterTextSplitter:
     def split(self, text: str) -> List[str]:
         """Split ``text`` into chunks preserving the configured overlap."""
 
-        step = self.chunk_size - self.chunk_overlap
-        return [text[i : i + self.chunk_size] for i in range(0, len(text), step)]
+        chunk_size = self.chunk_size
+        step = chunk_size - self.chunk_overlap
+        return [text[i : i + chunk_size] for i in range(0, len(text), step)]
 
     def split_texts(self, texts: List[str]) -> List[str]:
         """Split multiple texts and flatten the resulting chunks."""
@@ -126,11 +127,22 @@ class PDFLoader:
                 yield self._read_pdf(entry)
 
     def _read_pdf(self, file_path: Path) -> str:
-        with file_path.open("rb") as file_handle:
-            pdf_reader = PyPDF2.PdfReader(file_handle)
-            extracted_pages = [page.extract_text() or "" for page in pdf_reader.pages]
+        import fitz
+
+        with fitz.open(file_path) as document:
+            extracted_pages = [
+                self._extract_page_text(document.load_page(page_num))
+                for page_num in range(document.page_count)
+            ]
         return "\n".join(extracted_pages)
 
+    @staticmethod
+    def _extract_page_text(page: "fitz.Page") -> str:
+        # Pages without a content stream cannot hold text; skip layout analysis.
+        if not page.get_contents():
+            return ""
+        return page.get_text("text")
+
 
 if __name__ == "__main__":
     loader = TextFileLoader("data/KingLear.txt")
@@ -69,12 +69,37 @@ class VectorDatabase:
 
         return self.vectors.get(key)
 
-    async def abuild_from_list(self, list_of_text: List[str]) -> "VectorDatabase":
-        """Populate the vector store asynchronously from raw text snippets."""
-
-        embeddings = await self.embedding_model.async_get_embeddings(list_of_text)
-        for text, embedding in zip(list_of_text, embeddings):
-            self.insert(text, embedding)
+    async def abuild_from_list(
+        self,
+        list_of_text: List[str],
+        batch_size: int = 64,
+        max_concurrency: int = 8,
+    ) -> "VectorDatabase":
+        """Populate the vector store asynchronously from raw text snippets.
+
+        Texts are embedded in batches of ``batch_size`` with at most
+        ``max_concurrency`` embedding requests in flight at once.
+        """
+
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be a positive integer")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def embed_batch(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                return await self.embedding_model.async_get_embeddings(batch)
+
+        batches = [
+            list_of_text[i : i + batch_size]
+            for i in range(0, len(list_of_text), batch_size)
+        ]
+        batch_embeddings = await asyncio.gather(*(embed_batch(b) for b in batches))
+        for batch, embeddings in zip(batches, batch_embeddings):
+            for text, embedding in zip(batch, embeddings):
+                self.insert(text, embedding)
         return self
 
 
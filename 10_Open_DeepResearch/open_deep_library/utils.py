@@ -126,14 +126,14 @@ async def tavily_search(
     if not summarized_results:
         return "No valid search results found. Please try different search queries or use a different search API."
     
-    formatted_output = "Search results: \n\n"
+    output_parts = ["Search results: \n\n"]
     for i, (url, result) in enumerate(summarized_results.items()):
-        formatted_output += f"\n\n--- SOURCE {i+1}: {result['title']} ---\n"
-        formatted_output += f"URL: {url}\n\n"
-        formatted_output += f"SUMMARY:\n{result['content']}\n\n"
-        formatted_output += "\n\n" + "-" * 80 + "\n"
+        output_parts.append(f"\n\n--- SOURCE {i+1}: {result['title']} ---\n")
+        output_parts.append(f"URL: {url}\n\n")
+        output_parts.append(f"SUMMARY:\n{result['content']}\n\n")
+        output_parts.append("\n\n" + "-" * 80 + "\n")
     
-    return formatted_output
+    return "".join(output_parts)
 
 async def tavily_search_async(
     search_queries, 
@@ -5,6 +5,7 @@ If helpful, end; otherwise, continue the loop or terminate after a safe limit.
 """
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Dict, Any
 
 from langgraph.graph import StateGraph, END
@@ -18,8 +19,21 @@ from app.models import get_chat_model
 from app.tools import get_tool_belt
 
 
+_HELPFULNESS_PROMPT = PromptTemplate.from_template(
+    """
+  Given an initial query and a final response, determine if the final response is extremely helpful or not. Please indicate helpfulness with a 'Y' and unhelpfulness as an 'N'.
+
+  Initial Query:
+  {initial_query}
+
+  Final Response:
+  {final_response}"""
+)
+
+
+@lru_cache(maxsize=1)
 def _build_model_with_tools():
-    """Return a chat model instance bound to the current tool belt."""
+    """Return a cached chat model instance bound to the current tool belt."""
     model = get_chat_model()
     return model.bind_tools(get_tool_belt())
 
@@ -49,19 +63,9 @@ def helpfulness_node(state: AgentState) -> Dict[str, Any]:
     initial_query = state["messages"][0]
     final_response = state["messages"][-1]
 
-    prompt_template = """
-  Given an initial query and a final response, determine if the final response is extremely helpful or not. Please indicate helpfulness with a 'Y' and unhelpfulness as an 'N'.
-
-  Initial Query:
-  {initial_query}
-
-  Final Response:
-  {final_response}"""
-
-    helpfulness_prompt_template = PromptTemplate.from_template(prompt_template)
     helpfulness_check_model = get_chat_model(model_name="gpt-4.1-mini")
     helpfulness_chain = (
-        helpfulness_prompt_template | helpfulness_check_model | StrOutputParser()
+        _HELPFULNESS_PROMPT | helpfulness_check_model | StrOutputParser()
     )
 
     helpfulness_response = helpfulness_chain.invoke(
@@ -7,6 +7,7 @@ The graph:
 """
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Dict, Any
 
 from langgraph.graph import StateGraph, END
@@ -17,8 +18,9 @@ from app.models import get_chat_model
 from app.tools import get_tool_belt
 
 
+@lru_cache(maxsize=1)
 def _build_model_with_tools():
-    """Return a chat model instance bound to the current tool belt."""
+    """Return a cached chat model instance bound to the current tool belt."""
     model = get_chat_model()
     return model.bind_tools(get_tool_belt())
 
@@ -5,16 +5,23 @@ graphs can bind to their language models.
 """
 from __future__ import annotations
 
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
 from langchain_community.tools.tavily_search import TavilySearchResults
 from langchain_community.tools.arxiv.tool import ArxivQueryRun
 from app.rag import retrieve_information
 
 
+@lru_cache(maxsize=1)
+def _build_tool_belt() -> Tuple:
+    """Instantiate the shared tool instances once per process."""
+    tavily_tool = TavilySearchResults(max_results=5)
+    return (tavily_tool, ArxivQueryRun(), retrieve_information)
+
+
 def get_tool_belt() -> List:
     """Return the list of tools available to agents (Tavily, Arxiv, RAG)."""
-    tavily_tool = TavilySearchResults(max_results=5)
-    return [tavily_tool, ArxivQueryRun(), retrieve_information]
+    return list(_build_tool_belt())
 
 
@@ -1,5 +1,6 @@
 import os
 
+from collections import OrderedDict
 from collections.abc import AsyncIterable
 from typing import Any, Literal
 
@@ -12,7 +13,27 @@ from pydantic import BaseModel
 from app.agent_graph_with_helpfulness import build_agent_graph_with_helpfulness
 
 
-memory = MemorySaver()
+class BoundedMemorySaver(MemorySaver):
+    """In-memory checkpointer that keeps only the most recently used threads."""
+
+    def __init__(self, max_threads: int = 1000):
+        super().__init__()
+        self.max_threads = max_threads
+        self._thread_order: OrderedDict[str, None] = OrderedDict()
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        thread_id = config['configurable']['thread_id']
+        self._thread_order[thread_id] = None
+        self._thread_order.move_to_end(thread_id)
+        while len(self._thread_order) > self.max_threads:
+            evicted_thread_id, _ = self._thread_order.popitem(last=False)
+            self.delete_thread(evicted_thread_id)
+        return super().put(config, checkpoint, metadata, new_versions)
+
+
+memory = BoundedMemorySaver(
+    max_threads=int(os.getenv('CHECKPOINT_MAX_THREADS', '1000'))
+)
 
 class ResponseFormat(BaseModel):
     """Respond to the user in this format."""
@@ -57,29 +78,33 @@ class Agent:
         inputs = {'messages': [('user', query)]}
         config = {'configurable': {'thread_id': context_id}}
 
-        for item in self.graph.stream(inputs, config, stream_mode='values'):
-            message = item['messages'][-1]
-            if (
-                isinstance(message, AIMessage)
-                and message.tool_calls
-                and len(message.tool_calls) > 0
-            ):
-                yield {
-                    'is_task_complete': False,
-                    'require_user_input': False,
-                    'content': 'Searching for information...',
-                }
-            elif isinstance(message, ToolMessage):
-                yield {
-                    'is_task_complete': False,
-                    'require_user_input': False,
-                    'content': 'Processing the results...',
-                }
-
-        yield self.get_agent_response(config)
-
-    def get_agent_response(self, config):
-        current_state = self.graph.get_state(config)
+        # 'updates' yields only each node's new messages, not a full state copy
+        async for update in self.graph.astream(inputs, config, stream_mode='updates'):
+            for node_output in update.values():
+                if not isinstance(node_output, dict) or not node_output.get('messages'):
+                    continue
+                message = node_output['messages'][-1]
+                if (
+                    isinstance(message, AIMessage)
+                    and message.tool_calls
+                    and len(message.tool_calls) > 0
+                ):
+                    yield {
+                        'is_task_complete': False,
+                        'require_user_input': False,
+                        'content': 'Searching for information...',
+                    }
+                elif isinstance(message, ToolMessage):
+                    yield {
+                        'is_task_complete': False,
+                        'require_user_input': False,
+                        'content': 'Processing the results...',
+                    }
+
+        yield await self.get_agent_response(config)
+
+    async def get_agent_response(self, config):
+        current_state = await self.graph.aget_state(config)
         structured_response = current_state.values.get('structured_response')
         if structured_response and isinstance(
             structured_response, ResponseFormat
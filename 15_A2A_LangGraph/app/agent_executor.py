@@ -46,11 +46,15 @@ class GeneralAgentExecutor(AgentExecutor):
             await event_queue.enqueue_event(task)
         updater = TaskUpdater(event_queue, task.id, task.context_id)
         try:
-            logger.info(f"Starting agent stream for query: {query}")
+            logger.info("Starting agent stream for query: %s", query)
             async for item in self.agent.stream(query, task.context_id):
                 is_task_complete = item['is_task_complete']
                 require_user_input = item['require_user_input']
-                logger.info(f"Stream item - complete: {is_task_complete}, requires_input: {require_user_input}")
+                logger.info(
+                    "Stream item - complete: %s, requires_input: %s",
+                    is_task_complete,
+                    require_user_input,
+                )
 
                 if not is_task_complete and not require_user_input:
                     await updater.update_status(
@@ -81,7 +85,7 @@ class GeneralAgentExecutor(AgentExecutor):
                     break
 
         except Exception as e:
-            logger.error(f'An error occurred while streaming the response: {e}')
+            logger.error('An error occurred while streaming the response: %s', e)
             raise ServerError(error=InternalError()) from e
 
     def _validate_request(self, context: RequestContext) -> bool:
@@ -12,7 +12,7 @@ from langgraph.graph.message import add_messages
 from langgraph.prebuilt import ToolNode
 from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import StrOutputParser
-from langchain_core.messages import AIMessage
+from langchain_core.messages import AIMessage, SystemMessage
 
 
 class AgentState(TypedDict):
@@ -21,6 +21,24 @@ class AgentState(TypedDict):
     structured_response: Any  # ResponseFormat | None
 
 
+_HELPFULNESS_PROMPT = PromptTemplate.from_template(
+    """
+  Given an initial query and a final response, determine if the final response is extremely helpful or not. 
+  A helpful response should:
+  - Provide accurate and relevant information
+  - Be complete and address the user's specific need
+  - Use appropriate tools when necessary
+  
+  Please indicate helpfulness with a 'Y' and unhelpfulness as an 'N'.
+
+  Initial Query:
+  {initial_query}
+
+  Final Response:
+  {final_response}"""
+)
+
+
 def build_model_with_tools(model):
     """Return a model instance bound to the tool belt."""
     from app.tools import get_tool_belt
@@ -52,24 +70,8 @@ def helpfulness_node(state: Dict[str, Any], model) -> Dict[str, Any]:
     initial_query = state["messages"][0]
     final_response = state["messages"][-1]
 
-    prompt_template = """
-  Given an initial query and a final response, determine if the final response is extremely helpful or not. 
-  A helpful response should:
-  - Provide accurate and relevant information
-  - Be complete and address the user's specific need
-  - Use appropriate tools when necessary
-  
-  Please indicate helpfulness with a 'Y' and unhelpfulness as an 'N'.
-
-  Initial Query:
-  {initial_query}
-
-  Final Response:
-  {final_response}"""
-
-    helpfulness_prompt_template = PromptTemplate.from_template(prompt_template)
     helpfulness_chain = (
-        helpfulness_prompt_template | model | StrOutputParser()
+        _HELPFULNESS_PROMPT | model | StrOutputParser()
     )
 
     helpfulness_response = helpfulness_chain.invoke(
@@ -101,32 +103,35 @@ def build_agent_graph_with_helpfulness(model, system_instruction, format_instruc
     from app.tools import get_tool_belt
     from app.agent import ResponseFormat
     
+    # Per-graph invariants, built once and closed over by the agent node
+    model_with_tools = build_model_with_tools(model)
+    model_with_format = model.with_structured_output(
+        ResponseFormat,
+        method="json_schema",
+        include_raw=False
+    )
+    format_system_message = SystemMessage(
+        content=f"{system_instruction}\n\n{format_instruction}"
+    )
+    
     # Create model-bound functions
     def _call_model(state: AgentState) -> Dict[str, Any]:
         """Wrapper to pass model to call_model."""
-        model_with_tools = build_model_with_tools(model)
         messages = state["messages"]
         response = model_with_tools.invoke(messages)
         
         # If there are no tool calls, try to extract structured response
         if not getattr(response, "tool_calls", None):
             try:
-                # Apply response format to the model
-                model_with_format = model.with_structured_output(
-                    ResponseFormat,
-                    method="json_schema",
-                    include_raw=False
-                )
-                
                 # Add system and format instructions
-                formatted_messages = [("system", f"{system_instruction}\n\n{format_instruction}")] + state["messages"]
+                formatted_messages = [format_system_message, *state["messages"]]
                 structured_response = model_with_format.invoke(formatted_messages)
                 
                 return {
                     "messages": [response],
                     "structured_response": structured_response
                 }
-            except:
+            except Exception:
                 # If structured output fails, just return the response
                 return {"messages": [response]}
         else:
@@ -13,22 +13,23 @@ import os
 from functools import lru_cache
 from typing import Annotated, List
 
-import tiktoken
-from langchain_community.document_loaders import DirectoryLoader, PyMuPDFLoader
-from langchain_community.vectorstores import Qdrant
 from langchain_core.documents import Document
-from langchain_core.output_parsers import StrOutputParser
-from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.tools import tool
-from langchain_openai import ChatOpenAI
-from langchain_openai.embeddings import OpenAIEmbeddings
 from langgraph.graph import START, StateGraph
 from typing_extensions import TypedDict
 
 
+@lru_cache(maxsize=1)
+def _get_encoding() -> "tiktoken.Encoding":
+    """Return the cached tiktoken encoding used for chunk length measurement."""
+    import tiktoken
+
+    return tiktoken.encoding_for_model("gpt-4o")
+
+
 def _tiktoken_len(text: str) -> int:
     """Return token length using tiktoken; used for chunk length measurement."""
-    tokens = tiktoken.encoding_for_model("gpt-4o").encode(text)
+    tokens = _get_encoding().encode(text)
     return len(tokens)
 
 
@@ -49,6 +50,14 @@ def _build_rag_graph(data_dir: str):
     4) Define a chat prompt and generation model.
     5) Wire a two-node graph: retrieve -> generate.
     """
+    # Heavy integrations are imported here so importing the tool stays cheap
+    from langchain_community.document_loaders import DirectoryLoader, PyMuPDFLoader
+    from langchain_community.vectorstores import Qdrant
+    from langchain_core.output_parsers import StrOutputParser
+    from langchain_core.prompts import ChatPromptTemplate
+    from langchain_openai import ChatOpenAI
+    from langchain_openai.embeddings import OpenAIEmbeddings
+
     # Load PDFs from data directory (recursive)
     try:
         directory_loader = DirectoryLoader(
@@ -87,13 +96,13 @@ def _build_rag_graph(data_dir: str):
     )
     chat_prompt = ChatPromptTemplate.from_messages([("human", human_template)])
     generator_llm = ChatOpenAI(model=os.environ.get("OPENAI_CHAT_MODEL", "gpt-4.1-nano"))
+    generator_chain = chat_prompt | generator_llm | StrOutputParser()
 
     def retrieve(state: _RAGState) -> _RAGState:
         retrieved_docs = retriever.invoke(state["question"]) if retriever else []
         return {"context": retrieved_docs}  # type: ignore
 
     def generate(state: _RAGState) -> _RAGState:
-        generator_chain = chat_prompt | generator_llm | StrOutputParser()
         response_text = generator_chain.invoke(
             {"query": state["question"], "context": state.get("context", [])}
         )
@@ -99,9 +99,7 @@ async def main() -> None:
                 )
 
         except Exception as e:
-            logger.error(
-                f'Critical error fetching public agent card: {e}', exc_info=True
-            )
+            logger.exception('Critical error fetching public agent card: %s', e)
             raise RuntimeError(
                 'Failed to fetch the public agent card. Cannot continue.'
             ) from e
@@ -188,4 +186,9 @@ async def main() -> None:
 if __name__ == '__main__':
     import asyncio
 
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file
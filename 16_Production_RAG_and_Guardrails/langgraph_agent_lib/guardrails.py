@@ -115,7 +115,7 @@ def create_guardrails_guard(
         return guard
         
     except Exception as e:
-        logger.error(f"Failed to configure guardrails: {e}", exc_info=True)
+        logger.exception("Failed to configure guardrails: %s", e)
         raise RuntimeError(f"Failed to configure guardrails: {e}") from e
 
 
@@ -149,7 +149,7 @@ def create_factuality_guard(
         logger.info(f"Factuality guard configured with model: {eval_model}")
         return guard
     except Exception as e:
-        logger.error(f"Failed to configure factuality guard: {e}", exc_info=True)
+        logger.exception("Failed to configure factuality guard: %s", e)
         raise RuntimeError(f"Failed to configure factuality guard: {e}") from e
 
 
@@ -194,7 +194,7 @@ def validate_input(
     except RuntimeError:
         raise
     except Exception as e:
-        logger.error(f"Input validation error: {e}", exc_info=True)
+        logger.exception("Input validation error: %s", e)
         if raise_on_failure:
             raise RuntimeError(f"Input validation failed: {e}") from e
         return {
@@ -248,7 +248,7 @@ def validate_output(
     except RuntimeError:
         raise
     except Exception as e:
-        logger.error(f"Output validation error: {e}", exc_info=True)
+        logger.exception("Output validation error: %s", e)
         if raise_on_failure:
             raise RuntimeError(f"Output validation failed: {e}") from e
         return {
@@ -329,7 +329,7 @@ def create_guardrails_node(
                     logger.error(f"Output validation failed: {result.get('error')}")
                     
         except Exception as e:
-            logger.error(f"Guardrails validation error: {e}", exc_info=True)
+            logger.exception("Guardrails validation error: %s", e)
             if strict_mode:
                 raise
             validation_results.append({
@@ -10,7 +10,7 @@ from langchain_core.runnables.passthrough import RunnablePassthrough
 from langchain_qdrant import QdrantVectorStore
 from operator import itemgetter
 from qdrant_client import QdrantClient
-from qdrant_client.http.models import Distance, VectorParams
+from qdrant_client.http.models import Distance, PointStruct, VectorParams
 
 from .caching import CacheBackedEmbeddings
 from .models import get_openai_model
@@ -26,7 +26,8 @@ class ProductionRAGChain:
         embedding_model: str = "text-embedding-3-small",
         llm_model: str = "gpt-4.1-nano",
         cache_dir: str = "./cache",
-        collection_name: Optional[str] = None
+        collection_name: Optional[str] = None,
+        batch_size: int = 64
     ):
         """Initialize the production RAG chain.
         
@@ -38,6 +39,7 @@ class ProductionRAGChain:
             llm_model: OpenAI LLM model
             cache_dir: Directory for caching
             collection_name: Name for the vector collection
+            batch_size: Number of chunks embedded and upserted per request
         """
         self.file_path = file_path
         self.chunk_size = chunk_size
@@ -46,6 +48,7 @@ class ProductionRAGChain:
         self.llm_model = llm_model
         self.cache_dir = cache_dir
         self.collection_name = collection_name or f"pdf_collection_{uuid.uuid4().hex[:8]}"
+        self.batch_size = batch_size
         
         # Initialize components
         self._setup_text_splitter()
@@ -64,7 +67,8 @@ class ProductionRAGChain:
         """Set up cache-backed embeddings."""
         self.cached_embeddings = CacheBackedEmbeddings(
             model=self.embedding_model,
-            cache_dir=f"{self.cache_dir}/embeddings"
+            cache_dir=f"{self.cache_dir}/embeddings",
+            batch_size=self.batch_size
         )
     
     def _setup_vectorstore(self):
@@ -92,8 +96,26 @@ class ProductionRAGChain:
             embedding=self.cached_embeddings.get_embeddings()
         )
         
-        # Add documents
-        self.vectorstore.add_documents(docs)
+        # Embed in batches and upsert points directly, using the payload
+        # layout QdrantVectorStore reads back at retrieval time
+        embeddings = self.cached_embeddings.get_embeddings()
+        for start in range(0, len(docs), self.batch_size):
+            batch = docs[start:start + self.batch_size]
+            vectors = embeddings.embed_documents([doc.page_content for doc in batch])
+            client.upsert(
+                collection_name=self.collection_name,
+                points=[
+                    PointStruct(
+                        id=start + offset,
+                        vector=vector,
+                        payload={
+                            QdrantVectorStore.CONTENT_KEY: doc.page_content,
+                            QdrantVectorStore.METADATA_KEY: doc.metadata,
+                        },
+                    )
+                    for offset, (doc, vector) in enumerate(zip(batch, vectors))
+                ],
+            )
         
         # Create retriever
         self.retriever = self.vectorstore.as_retriever(